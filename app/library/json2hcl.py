@@ -1,50 +1,117 @@
 """Utilities for converting validated Terragrunt JSON to HCL output.
 
-  This module exposes a single helper that takes a Pydantic model and writes a
-  Terragrunt-compatible HCL file. Imports that may not exist in all environments
-  (like `hcl2`) are performed inside the function to avoid import-time errors.
+  This module exposes a helper that takes a Pydantic model and renders
+  Terragrunt-compatible HCL; writing the result is left to the caller. Callers
+  can pin renderings of frequently used models with `pin_hcl_rendering`. Imports
+  that may not exist in all environments (like `hcl2`) are resolved once at
+  import time and guarded so that a missing dependency only surfaces when the
+  helper is actually called.
   """
+import json
+from functools import lru_cache
+
 from pydantic import BaseModel
 
+try:
+    from hcl2.api import reverse_transform as _reverse_transform, writes as _writes  # type: ignore  # pylint: disable=import-error
+except ImportError:  # pragma: no cover - depends on the environment
+    _reverse_transform = None  # pylint: disable=invalid-name
+    _writes = None  # pylint: disable=invalid-name
+
+_INCLUDE_PATH = "find_in_parent_folders()"
+_DEFAULT_INCLUDE = {"path": _INCLUDE_PATH}
+
+# Payloads larger than this (serialized) bypass the render cache, bounding its
+# memory to roughly 256 entries of this size plus their rendered HCL.
+_MAX_CACHED_KEY_LEN = 16_384
+
 
-def generate_terragrunt_hcl_from_model(model: BaseModel, output_file_path: str) -> str:
+@lru_cache(maxsize=256)
+def _render_hcl(frozen_json: str) -> str:
+    """Render a JSON-encoded Terragrunt config to an HCL2 string.
+
+    Rendering is a pure function of the payload, so results are memoized on the
+    serialized form. Key order is part of the cache key because it determines the
+    order of blocks and attributes in the generated HCL.
     """
-    Convert a Pydantic model instance representing a Terragrunt config into HCL2
-    and write it to a file.
+    hcl_ast = _reverse_transform(json.loads(frozen_json))
+    return _writes(hcl_ast)
+
+
+def _to_hcl_dict(model: BaseModel) -> dict:
+    """Dump a Terragrunt model to the normalized dict fed to `reverse_transform`."""
+    # Convert model to a plain dict (Pydantic v2: model_dump), leaving out
+    # unset optionals so they do not reach the HCL AST
+    json_data = model.model_dump(exclude_none=True)
+
+    # Empty lists in the terraform block are equivalent to omitting them
+    terraform_block = json_data.get("terraform")
+    if isinstance(terraform_block, dict):
+        json_data["terraform"] = {
+            key: value
+            for key, value in terraform_block.items()
+            if not (isinstance(value, list) and not value)
+        }
+
+    # Normalize the 'include' block to ensure the special path is used by default
+    include_block = json_data.get("include")
+    if isinstance(include_block, dict):
+        include_block["path"] = _INCLUDE_PATH
+    else:
+        json_data["include"] = dict(_DEFAULT_INCLUDE)
+
+    return json_data
+
+
+# Pinned renderings, keyed like `_render_hcl`. These sit on top of the LRU cache
+# so frequently posted configs (e.g. the default from /docs) are never evicted.
+# Values are filled lazily on first use.
+_PINNED_HCL: dict[str, str | None] = {}
+
+
+def pin_hcl_rendering(model: BaseModel) -> None:
+    """Keep the HCL rendering of `model` cached for the life of the process.
+
+    Only the cache key is computed here; the HCL itself is rendered the first
+    time a matching model is passed to `generate_terragrunt_hcl_from_model`.
+
+    Args:
+        model (BaseModel): Pydantic model instance whose rendering to pin.
+    """
+    key = json.dumps(_to_hcl_dict(model), separators=(",", ":"))
+    _PINNED_HCL.setdefault(key, None)
+
+
+def generate_terragrunt_hcl_from_model(model: BaseModel) -> str:
+    """
+    Convert a Pydantic model instance representing a Terragrunt config into HCL2.
 
     This is intended to be used with schemas like `schemas.terragrunt_example.VPC`.
 
     Args:
         model (BaseModel): Pydantic model instance (e.g., `vpc`).
-        output_file_path (str): The path to the output terragrunt.hcl file.
 
     Returns:
         str: The generated HCL content.
+
+    Raises:
+        ImportError: If the optional `hcl2` dependency is not installed.
     """
-    try:
-        # Import here to avoid import errors at module import time. The inline
-        # pylint directives acknowledge this is intentional and optional.
-        from hcl2.api import reverse_transform, writes  # type: ignore  # pylint: disable=import-outside-toplevel, import-error
-
-        # Convert model to a plain dict (Pydantic v2: model_dump)
-        json_data = model.model_dump()
-
-        # Normalize the 'include' block to ensure the special path is used by default
-        include_block = json_data.get("include")
-        if isinstance(include_block, dict):
-            include_block["path"] = "find_in_parent_folders()"
-            json_data["include"] = include_block
-        else:
-            json_data["include"] = {"path": "find_in_parent_folders()"}
-
-        # Convert dict to HCL2 AST and then to string
-        hcl_ast = reverse_transform(json_data)
-        hcl_content = writes(hcl_ast)
-
-        with open(output_file_path, "w", encoding="utf-8") as f:
-            f.write(hcl_content)
-
-        return hcl_content
-    except Exception as e:
-        # Surface the error to the caller (FastAPI will format it)
-        raise e
+    if _reverse_transform is None or _writes is None:
+        raise ImportError("python-hcl2 is required to generate HCL output")
+
+    # Cached renderings are keyed on the serialized dict: key order drives output order
+    json_data = _to_hcl_dict(model)
+    key = json.dumps(json_data, separators=(",", ":"))
+    if key in _PINNED_HCL:
+        pinned = _PINNED_HCL[key]
+        if pinned is None:
+            pinned = _PINNED_HCL[key] = _writes(_reverse_transform(json_data))
+        return pinned
+
+    # Oversized payloads are rendered directly so they cannot pin memory
+    if len(key) > _MAX_CACHED_KEY_LEN:
+        return _writes(_reverse_transform(json_data))
+
+    # Convert dict to HCL2 AST and then to string (memoized per payload)
+    return _render_hcl(key)
@@ -1,29 +1,37 @@
 """FastAPI application entrypoint for Terragrunt Automation API."""
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from routers import config_creation
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.include_router(config_creation.router)
 
+# Probe bodies never change, so they are encoded once; each request still gets
+# its own Response object. The routes keep `response_model` so the documented
+# contract stays in OpenAPI.
+_ROOT_BODY = ORJSONResponse({"Hello": "World"}).body
+_HEALTHZ_BODY = ORJSONResponse({"status": "ok"}).body
+_READYZ_BODY = ORJSONResponse({"status": "ready"}).body
 
-@app.get("/")
-async def read_root():
+
+@app.get("/", response_model=dict[str, str])
+async def read_root() -> Response:
     """Health check endpoint to verify the API is running."""
-    return {"Hello": "World"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/healthz")
-async def healthz() -> dict[str, str]:
+@app.get("/healthz", response_model=dict[str, str])
+async def healthz() -> Response:
     """Liveness probe: return 200 OK if the process is alive."""
-    return {"status": "ok"}
+    return Response(_HEALTHZ_BODY, media_type="application/json")
 
 
-@app.get("/readyz")
-async def readyz() -> dict[str, str]:
+@app.get("/readyz", response_model=dict[str, str])
+async def readyz() -> Response:
     """Readiness probe: return 200 OK when the app is ready to serve requests.
 
     In a minimal setup (no external deps), this mirrors liveness. Add checks here
     for DB connections, external services, or configuration as needed.
     """
-    return {"status": "ready"}
+    return Response(_READYZ_BODY, media_type="application/json")
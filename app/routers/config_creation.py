@@ -1,33 +1,102 @@
 """API route(s) for generating Terragrunt HCL from validated payloads."""
 
+import asyncio
 import os
-from pathlib import Path
-from fastapi import APIRouter
-from schemas.terragrunt_example import VPC
-from library.json2hcl import generate_terragrunt_hcl_from_model
+import tempfile
+from typing import Annotated
+from fastapi import APIRouter, Body
+from schemas.terragrunt_example import TerragruntConfig, VPC, VPC_EXAMPLE, VPCResponse
+from library.json2hcl import generate_terragrunt_hcl_from_model, pin_hcl_rendering
 
 router = APIRouter()
 
+# Clients commonly post the default config as-is (e.g. from /docs); keep its HCL
+# cached permanently.
+pin_hcl_rendering(TerragruntConfig())
 
-@router.post("/tf/vpc")
-async def create_vpc(payload: VPC):
+# Parent directories already created by this process; avoids a mkdir per request.
+# Keys come from client-supplied paths, so the set is cleared once it gets large.
+_MKDIR_CACHE: set[str] = set()
+_MKDIR_CACHE_MAX = 1024
+
+# Mode for new HCL files, matching what open(path, "w") would create. Reading the
+# umask means setting it, so this is done once at import rather than per write.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _ensure_dir(path: str) -> None:
+    """Create `path` (and parents) unless this process already did so."""
+    if path in _MKDIR_CACHE:
+        return
+    os.makedirs(path, exist_ok=True)
+    if len(_MKDIR_CACHE) >= _MKDIR_CACHE_MAX:
+        _MKDIR_CACHE.clear()
+    _MKDIR_CACHE.add(path)
+
+
+def _write_file(path: str, content: str) -> None:
+    """Atomically write `content` to `path` as UTF-8.
+
+    The bytes go to a temp file in the same directory with raw fd writes (no text
+    IO stack), which is then renamed over `path`. Concurrent writers to the same
+    path therefore leave one complete payload rather than interleaved content.
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".", suffix=".tmp")
+    try:
+        try:
+            os.fchmod(fd, _FILE_MODE)
+            # A small HCL file normally goes out in a single write
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_hcl(path: str, content: str) -> None:
+    """Write `content` to `path`, creating its directory first if needed.
+
+    Runs in a worker thread, so all blocking filesystem calls stay off the event
+    loop. The directory cache can go stale when a cached parent is removed (e.g.
+    by a /tmp cleaner), so a missing directory triggers one mkdir-and-retry.
+    """
+    parent = os.path.dirname(path)
+    _ensure_dir(parent)
+    try:
+        _write_file(path, content)
+    except FileNotFoundError:
+        _MKDIR_CACHE.discard(parent)
+        _ensure_dir(parent)
+        _write_file(path, content)
+
+
+@router.post("/tf/vpc", response_model=VPCResponse)
+async def create_vpc(
+    payload: Annotated[VPC, Body(examples=[VPC_EXAMPLE])],
+) -> VPCResponse:
     """Create a Terragrunt HCL file for the provided VPC configuration.
 
     The request payload includes an output path and a nested Terragrunt config.
     This endpoint materializes the HCL and writes it to the requested path.
     """
 
-    # Resolve destination path and ensure directory exists
-    output_path = Path(os.path.expanduser(payload.conf_path)).resolve()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Resolve destination path (string-only, no stat)
+    output_path = os.path.abspath(os.path.expanduser(payload.conf_path))
+
+    # Generate HCL from the nested Terragrunt module
+    hcl_content = generate_terragrunt_hcl_from_model(payload.terragrunt)
 
-    # Generate HCL from the nested Terragrunt module and write to the requested path
-    hcl_content = generate_terragrunt_hcl_from_model(
-        payload.terragrunt, str(output_path)
-    )
+    # Create the directory and write the file in a worker thread to keep the
+    # event loop free
+    await asyncio.to_thread(_write_hcl, output_path, hcl_content)
 
-    return {
-        "hcl_path": str(output_path),
-        "hcl": hcl_content,
-        "payload": payload.model_dump(),
-    }
+    return VPCResponse(hcl_path=output_path, hcl=hcl_content)
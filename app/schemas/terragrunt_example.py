@@ -1,9 +1,9 @@
 """Pydantic schemas for Terragrunt configuration payloads.
 
 This module defines nested models for Include, Terraform, Inputs, and wrapper
-models for submitting Terragrunt configuration to the API.
+models for submitting Terragrunt configuration to the API and describing its
+responses.
 """
-from typing import Literal
 from pydantic import BaseModel, Field
 
 
@@ -13,12 +13,14 @@ class Include(BaseModel):
     Controls how this module inherits configuration from parent folders.
 
     Attributes:
-        path (Literal["find_in_parent_folders()"] | str): Special value
+        path (str): Special value
             'find_in_parent_folders()' to auto-discover the parent terragrunt.hcl,
             or a string path to a specific parent directory/file.
     """
 
-    path: Literal["find_in_parent_folders()"] | str = Field(
+    model_config = {"extra": "forbid", "frozen": True, "validate_assignment": False}
+
+    path: str = Field(
         default="find_in_parent_folders()",
         description=(
             "Special value 'find_in_parent_folders()' to auto-discover parent terragrunt.hcl, "
@@ -30,6 +32,8 @@ class Include(BaseModel):
 class Hook(BaseModel):
     """Hook to run before/after specific Terraform commands."""
 
+    model_config = {"extra": "forbid", "frozen": True, "validate_assignment": False}
+
     name: str = Field(description="Name of the hook.")
     commands: list[str] = Field(
         default_factory=list,
@@ -56,6 +60,8 @@ class Hook(BaseModel):
 class ExtraArguments(BaseModel):
     """Additional CLI args/env for specific Terraform commands."""
 
+    model_config = {"extra": "forbid", "frozen": True, "validate_assignment": False}
+
     name: str = Field(description="Name of this argument set.")
     commands: list[str] = Field(
         default_factory=list,
@@ -112,6 +118,8 @@ class Terraform(BaseModel):
 class Inputs(BaseModel):
     """Inputs passed to the Terraform module via Terragrunt."""
 
+    model_config = {"extra": "forbid", "frozen": True, "validate_assignment": False}
+
     vpc_name: str = Field(
         default="production-vpc",
         description="Human-readable name for the VPC.",
@@ -162,69 +170,73 @@ class VPC(BaseModel):
         description="The Terragrunt module configuration.",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
+
+class VPCResponse(BaseModel):
+    """Response returned after generating a VPC Terragrunt config."""
+
+    hcl_path: str = Field(description="Path the generated terragrunt.hcl was written to.")
+    hcl: str = Field(description="The generated HCL content.")
+
+
+# Example request body for the /tf/vpc route. Kept out of `VPC.model_config` so it
+# is only attached to the route's OpenAPI docs, not built into the model schema.
+VPC_EXAMPLE: dict = {
+    "conf_path": "/tmp/terragrunt_vpc.hcl",
+    "terragrunt": {
+        "include": {"path": "find_in_parent_folders()"},
+        "terraform": {
+            "source": (
+                "git::git@github.com:my-org/terraform-modules.git//vpc"
+                "?ref=v1.2.0"
+            ),
+            "include_in_copy": [
+                "README.md",
+                "modules/common/variables.tf",
+            ],
+            "extra_arguments": [
+                {
+                    "name": "common-vars",
+                    "commands": ["plan", "apply"],
+                    "arguments": [
+                        "-lock-timeout=10m",
+                        "-parallelism=10",
+                    ],
+                    "optional_var_files": [
+                        "env/${TG_VAR_environment}.tfvars",
+                    ],
+                    "env_vars": {"TF_LOG": "WARN"},
+                }
+            ],
+            "before_hook": [
+                {
+                    "name": "fmt",
+                    "commands": ["plan", "apply"],
+                    "execute": ["tofu", "fmt", "-recursive"],
+                    "run_on_error": False,
+                }
+            ],
+            "after_hook": [
                 {
-                    "conf_path": "/tmp/terragrunt_vpc.hcl",
-                    "terragrunt": {
-                        "include": {"path": "find_in_parent_folders()"},
-                        "terraform": {
-                            "source": (
-                                "git::git@github.com:my-org/terraform-modules.git//vpc"
-                                "?ref=v1.2.0"
-                            ),
-                            "include_in_copy": [
-                                "README.md",
-                                "modules/common/variables.tf",
-                            ],
-                            "extra_arguments": [
-                                {
-                                    "name": "common-vars",
-                                    "commands": ["plan", "apply"],
-                                    "arguments": [
-                                        "-lock-timeout=10m",
-                                        "-parallelism=10",
-                                    ],
-                                    "optional_var_files": [
-                                        "env/${TG_VAR_environment}.tfvars",
-                                    ],
-                                    "env_vars": {"TF_LOG": "WARN"},
-                                }
-                            ],
-                            "before_hook": [
-                                {
-                                    "name": "fmt",
-                                    "commands": ["plan", "apply"],
-                                    "execute": ["tofu", "fmt", "-recursive"],
-                                    "run_on_error": False,
-                                }
-                            ],
-                            "after_hook": [
-                                {
-                                    "name": "notify",
-                                    "commands": ["apply"],
-                                    "execute": [
-                                        "bash",
-                                        "-lc",
-                                        "echo 'Apply finished'",
-                                    ],
-                                    "run_on_error": False,
-                                }
-                            ],
-                        },
-                        "inputs": {
-                            "vpc_name": "production-vpc",
-                            "vpc_cidr": "10.0.0.0/16",
-                            "enable_dns_support": True,
-                            "public_subnets": [
-                                "10.0.1.0/24",
-                                "10.0.2.0/24",
-                            ],
-                            "tags": {"project": "web-app", "environment": "prod"},
-                        },
-                    },
+                    "name": "notify",
+                    "commands": ["apply"],
+                    "execute": [
+                        "bash",
+                        "-lc",
+                        "echo 'Apply finished'",
+                    ],
+                    "run_on_error": False,
                 }
-            ]
-        }
-    }
+            ],
+        },
+        "inputs": {
+            "vpc_name": "production-vpc",
+            "vpc_cidr": "10.0.0.0/16",
+            "enable_dns_support": True,
+            "public_subnets": [
+                "10.0.1.0/24",
+                "10.0.2.0/24",
+            ],
+            "tags": {"project": "web-app", "environment": "prod"},
+        },
+    },
+}